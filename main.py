@@ -1,11 +1,22 @@
+import asyncio
+import ipaddress
 import logging
 import os
-import time
+import random
+import re
+import socket
 import sys
-from typing import Optional, Any
-import requests
+import threading
+from typing import Awaitable, Callable, Mapping, Optional, Any
+import httpx
 from dotenv import load_dotenv
 
+try:
+    from pyroute2 import IPRoute
+    from pyroute2.netlink.rtnl import RTMGRP_IPV4_IFADDR
+except ImportError:
+    IPRoute = None
+
 load_dotenv()
 
 
@@ -18,6 +29,94 @@ logging.basicConfig(
     ]
 )
 
+# httpx logs every request at INFO level; keep the output focused on DNS updates
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+
+# Bounds every HTTP call: 3.05s to connect, 10s for reads, writes and pool waits
+_TIMEOUT: httpx.Timeout = httpx.Timeout(10.0, connect=3.05)
+
+
+def build_client() -> httpx.AsyncClient:
+    """
+    Builds an HTTP/2 capable async httpx client with connection pooling and connect retries.
+    :return: A configured async httpx client.
+    """
+    transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_keepalive_connections=8)
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=_TIMEOUT
+    )
+
+
+# Status codes considered transient and worth retrying
+_RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+async def _retry(
+    fn: Callable[[], Awaitable[httpx.Response]],
+    attempts: int = 5,
+    base: float = 1.0,
+    cap: float = 60.0
+) -> httpx.Response:
+    """
+    Runs an HTTP request with exponential backoff and jitter on transient errors.
+    :param fn: A callable returning the request coroutine to await.
+    :param attempts: Maximum number of attempts.
+    :param base: Base delay in seconds.
+    :param cap: Maximum delay in seconds.
+    :return: The last HTTP response received.
+    """
+    for i in range(attempts):
+        last: bool = i == attempts - 1
+
+        try:
+            response: httpx.Response = await fn()
+
+            if response.status_code not in _RETRY_STATUSES or last:
+                return response
+
+            logging.warning("Transient HTTP %s from %s. Retrying...", response.status_code, response.url)
+
+        except httpx.TimeoutException as e:
+            if last:
+                raise
+
+            logging.warning("Request timed out (%s): %s. Retrying...", type(e).__name__, e)
+
+        except httpx.TransportError as e:
+            if last:
+                raise
+
+            logging.warning("Transient network error: %s. Retrying...", e)
+
+        await asyncio.sleep(min(cap, base * 2 ** i) * random.uniform(0.7, 1.3))
+
+    raise RuntimeError('Retry attempts must be at least 1')
+
+
+# Public IP providers raced against each other on every lookup
+_IP_PROVIDERS: tuple[str, ...] = (
+    'https://api.ipify.org?format=json',
+    'https://ifconfig.co/ip',
+    'https://ipv4.icanhazip.com'
+)
+
+
+# Matches numbered API token variables such as API_TOKEN_1
+_API_TOKEN_KEY: re.Pattern[str] = re.compile(r'API_TOKEN_(\d+)')
+
+# Upper bound on numbered records so a runaway configuration cannot flood the API
+_MAX_RECORDS: int = 256
+
+
+# Environment values accepted as True by parse_bool
+_TRUE_SET: frozenset[str] = frozenset({'1', 'true', 'yes', 'y', 'on'})
+
 
 def parse_bool(value: Optional[str], default: bool = True) -> bool:
     """
@@ -28,7 +127,28 @@ def parse_bool(value: Optional[str], default: bool = True) -> bool:
     if value is None:
         return default
     
-    return value.strip().lower() in ('1', 'true', 'yes', 'y', 'on')
+    return value.strip().lower() in _TRUE_SET
+
+
+def _listed_records(body: Any) -> list[dict[str, Any]]:
+    """
+    Extracts the DNS records from a Cloudflare listing, ignoring malformed entries.
+    :param body: The decoded JSON body of the listing.
+    :return: The records carrying an ID, a name and a content.
+    :raises ValueError: If the body is not a JSON object.
+    """
+    if not isinstance(body, dict):
+        raise ValueError(f'Unexpected DNS records listing: {body!r}')
+
+    result: Any = body.get('result')
+
+    if not isinstance(result, list):
+        return []
+
+    return [
+        record for record in result
+        if isinstance(record, dict) and all(key in record for key in ('id', 'name', 'content'))
+    ]
 
 
 class CloudflareUpdater:
@@ -37,6 +157,7 @@ class CloudflareUpdater:
         api_token: str,
         zone_id: str,
         record_name: str,
+        client: httpx.AsyncClient,
         proxied: bool = True,
         api_url: str = 'https://api.cloudflare.com/client/v4'
     ) -> None:
@@ -45,86 +166,290 @@ class CloudflareUpdater:
         self.record_name: str = record_name
         self.proxied: bool = proxied
         self.api_url: str = api_url
-
-    def get_dns_record_id(self) -> Optional[str]:
-        """
-        Retrieves the DNS record ID for the specified record name.
-        :return: The DNS record ID as a string, or None if not found.
-        """
-        url: str = f"{self.api_url}/zones/{self.zone_id}/dns_records"
-        headers: dict[str, str] = {
+        self._client: httpx.AsyncClient = client
+        self._headers: dict[str, str] = {
             'Authorization': f"Bearer {self.api_token}",
             'Content-Type': 'application/json'
         }
+        self._list_url: str = f"{self.api_url}/zones/{self.zone_id}/dns_records"
+        self._put_url: Optional[str] = None
+        self._put_body: dict[str, Any] = {
+            'type': 'A',
+            'name': self.record_name,
+            'ttl': 120,
+            'proxied': self.proxied
+        }
+        self._record_id: Optional[str] = None
+        self._content: Optional[str] = None
+        self._listed_proxied: Optional[bool] = None
+        self._listed_ttl: Optional[int] = None
+
+    def cache_record(self, record_id: str, content: str, proxied: Optional[bool], ttl: Optional[int]) -> None:
+        """
+        Stores a DNS record ID and current settings fetched elsewhere (e.g. by a zone-wide listing).
+        :param record_id: The DNS record ID.
+        :param content: The current content of the DNS record.
+        :param proxied: The current proxied flag of the DNS record.
+        :param ttl: The current TTL of the DNS record.
+        """
+        self._record_id = record_id
+        self._content = content
+        self._listed_proxied = proxied
+        self._listed_ttl = ttl
+        self._put_url = f"{self._list_url}/{record_id}"
+
+    def clear_cached_record(self) -> None:
+        """ Forgets the cached DNS record so the next update fetches it again. """
+        self._record_id = None
+        self._content = None
+        self._listed_proxied = None
+        self._listed_ttl = None
+        self._put_url = None
+
+    def is_up_to_date(self, new_ip: str) -> bool:
+        """
+        Returns whether the cached record already has the target content, proxied flag and TTL.
+        :param new_ip: The new public IP address.
+        """
+        return (
+            self._content == new_ip
+            and self._listed_proxied == self._put_body['proxied']
+            and self._listed_ttl == self._put_body['ttl']
+        )
+
+    def has_cached_record(self) -> bool:
+        """ Returns whether the DNS record ID is already cached. """
+        return self._record_id is not None
+
+    async def get_dns_record(self) -> Optional[tuple[str, str]]:
+        """
+        Retrieves the DNS record ID and current content for the specified record name and caches them.
+        :return: A tuple of (record ID, content), or None if not found.
+        """
         params: dict[str, str] = {
             'type': 'A',
             'name': self.record_name
         }
 
         try:
-            response: requests.Response = requests.get(url, headers=headers, params=params)
+            response: httpx.Response = await _retry(
+                lambda: self._client.get(self._list_url, headers=self._headers, params=params)
+            )
             response.raise_for_status()
-            records: list[dict[str, Any]] = response.json().get('result', [])
+            records: list[dict[str, Any]] = _listed_records(response.json())
 
             if not records:
-                logging.error(f'DNS record not found for {self.record_name}')
+                logging.error('DNS record not found for %s', self.record_name)
                 return None
 
-            return records[0]['id']
+            self.cache_record(
+                records[0]['id'], records[0]['content'], records[0].get('proxied'), records[0].get('ttl')
+            )
+            return records[0]['id'], records[0]['content']
             
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching DNS record ID: {e}")
+        except (httpx.HTTPError, ValueError) as e:
+            logging.error("Error fetching DNS record: %s", e)
             return None
 
-    def update_dns_record(self, new_ip: str) -> None:
+    async def update_dns_record(self, new_ip: str) -> None:
         """
         Updates the DNS record with the new IP address.
         :param new_ip: The new public IP address.
         """
-        record_id: Optional[str] = self.get_dns_record_id()
+        # Try with the cached ID first and refresh it once if Cloudflare no longer knows it
+        for attempt in range(2):
+            if self._record_id is None:
+                await self.get_dns_record()
+
+            put_url: Optional[str] = self._put_url
+
+            if not put_url:
+                logging.error("Unable to update DNS record: Record ID not found for %s", self.record_name)
+                return
+
+            if self.is_up_to_date(new_ip):
+                logging.debug("DNS record %s already points to %s. Skipping...", self.record_name, new_ip)
+                return
+
+            data: dict[str, Any] = {**self._put_body, 'content': new_ip}
+
+            try:
+                response: httpx.Response = await _retry(
+                    lambda: self._client.put(put_url, headers=self._headers, json=data)
+                )
+
+                if response.status_code == 404 and attempt == 0:
+                    logging.warning("Cached DNS record ID for %s is no longer valid. Refreshing...", self.record_name)
+                    self.clear_cached_record()
+                    continue
+
+                response.raise_for_status()
+                self._content = new_ip
+                self._listed_proxied = self._put_body['proxied']
+                self._listed_ttl = self._put_body['ttl']
+                logging.info(
+                    "DNS record updated successfully: %s -> %s (proxied=%s)", self.record_name, new_ip, self.proxied
+                )
+
+            except httpx.HTTPError as e:
+                logging.error("Error updating DNS record: %s", e)
 
-        if not record_id:
-            logging.error(f"Unable to update DNS record: Record ID not found for {self.record_name}")
             return
 
-        url: str = f"{self.api_url}/zones/{self.zone_id}/dns_records/{record_id}"
-        headers: dict[str, str] = {
+
+class ZoneUpdater:
+    def __init__(
+        self,
+        api_token: str,
+        zone_id: str,
+        client: httpx.AsyncClient,
+        api_url: str = 'https://api.cloudflare.com/client/v4'
+    ) -> None:
+        self.api_token: str = api_token
+        self.zone_id: str = zone_id
+        self.api_url: str = api_url
+        self.updaters: list[CloudflareUpdater] = []
+        self._client: httpx.AsyncClient = client
+        self._headers: dict[str, str] = {
             'Authorization': f"Bearer {self.api_token}",
             'Content-Type': 'application/json'
         }
-        data: dict[str, Any] = {
-            'type': 'A',
-            'name': self.record_name,
-            'content': new_ip,
-            'ttl': 120,
-            'proxied': self.proxied
-        }
+        self._list_url: str = f"{self.api_url}/zones/{self.zone_id}/dns_records"
+
+    async def fetch_records(self) -> None:
+        """
+        Lists every A record of the zone (100 per page) and caches the ID and content on each updater.
+        Updaters whose record is not listed keep resolving it on their own.
+        """
+        records: dict[str, dict[str, Any]] = {}
+        page: int = 1
+        total_pages: int = 1
 
         try:
-            response: requests.Response = requests.put(url, headers=headers, json=data)
-            response.raise_for_status()
-            logging.info(
-                f"DNS record updated successfully: {self.record_name} -> {new_ip} (proxied={self.proxied})"
-            )
-            
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error updating DNS record: {e}")
+            while page <= total_pages:
+                params: dict[str, Any] = {'type': 'A', 'per_page': 100, 'page': page}
+                response: httpx.Response = await _retry(
+                    lambda: self._client.get(self._list_url, headers=self._headers, params=params)
+                )
+                response.raise_for_status()
+                body: Any = response.json()
+
+                for item in _listed_records(body):
+                    records[item['name']] = item
+
+                result_info: Any = body.get('result_info') or {}
+                total_pages = result_info.get('total_pages', 1) if isinstance(result_info, dict) else 1
+                page += 1
+
+        except (httpx.HTTPError, ValueError) as e:
+            logging.error("Error listing DNS records for zone %s: %s", self.zone_id, e)
+            return
+
+        for updater in self.updaters:
+            record: Optional[dict[str, Any]] = records.get(updater.record_name)
 
-    @staticmethod
-    def get_public_ip() -> Optional[str]:
+            if record is not None:
+                updater.cache_record(record['id'], record['content'], record.get('proxied'), record.get('ttl'))
+
+    async def update_all(self, new_ip: str) -> None:
         """
-        Fetches the public IP address using an external service.
-        :return: The public IP address as a string, or None if an error occurs.
+        Updates every DNS record of the zone with the new IP address.
+        :param new_ip: The new public IP address.
         """
-        try:
-            response: requests.Response = requests.get('https://api.ipify.org?format=json')
-            response.raise_for_status()
-            ip_data: dict[str, Any] = response.json()
-            return ip_data.get('ip')
-        
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching public IP: {e}")
-            return None
+        if any(not updater.has_cached_record() for updater in self.updaters):
+            try:
+                await self.fetch_records()
+
+            except Exception as e:
+                # Updaters still resolve their own records if the zone listing fails
+                logging.error("Unexpected error listing DNS records for zone %s: %s", self.zone_id, e)
+
+        results: list[Any] = await asyncio.gather(
+            *(updater.update_dns_record(new_ip) for updater in self.updaters),
+            return_exceptions=True
+        )
+
+        for updater, result in zip(self.updaters, results):
+            if isinstance(result, Exception):
+                logging.error("Unexpected error updating %s: %s", updater.record_name, result)
+
+
+async def _fetch_ip(client: httpx.AsyncClient, url: str) -> Optional[str]:
+    """
+    Fetches the public IP address from a single provider.
+    :param client: The HTTP client used to perform the request.
+    :param url: The provider URL. JSON responses are expected to carry an 'ip' field.
+    :return: The public IPv4 address as a string, or None if an error occurs or the answer is not a global address.
+    """
+    try:
+        response: httpx.Response = await client.get(url)
+        response.raise_for_status()
+
+        ip: Any
+
+        if response.headers.get('content-type', '').startswith('application/json'):
+            data: Any = response.json()
+            ip = data.get('ip') if isinstance(data, dict) else None
+        else:
+            ip = response.text.strip()
+
+    except (httpx.HTTPError, ValueError) as e:
+        logging.warning("Error fetching public IP from %s: %s", url, e)
+        return None
+
+    # Reject malformed or non-public answers (e.g. from captive portals) before they reach Cloudflare
+    if not isinstance(ip, str):
+        logging.warning("Invalid public IP %r returned by %s", ip, url)
+        return None
+
+    try:
+        address: ipaddress.IPv4Address = ipaddress.IPv4Address(ip)
+
+    except ValueError:
+        logging.warning("Invalid public IP %r returned by %s", ip, url)
+        return None
+
+    if not address.is_global:
+        logging.warning("Non-public IP %s returned by %s", address, url)
+        return None
+
+    return str(address)
+
+
+async def get_public_ip(client: httpx.AsyncClient, timeout: float = 5.0) -> Optional[str]:
+    """
+    Fetches the public IP address by racing several external services.
+    The first provider to answer successfully wins and the others are cancelled.
+    :param client: The HTTP client used to perform the requests.
+    :param timeout: Maximum time in seconds to wait for any provider.
+    :return: The public IP address as a string, or None if an error occurs.
+    """
+    tasks: set[asyncio.Task[Optional[str]]] = {
+        asyncio.create_task(_fetch_ip(client, url)) for url in _IP_PROVIDERS
+    }
+    deadline: float = asyncio.get_running_loop().time() + timeout
+
+    try:
+        while tasks:
+            remaining: float = deadline - asyncio.get_running_loop().time()
+
+            if remaining <= 0:
+                break
+
+            done, tasks = await asyncio.wait(tasks, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                ip: Optional[str] = task.result()
+
+                if ip:
+                    return ip
+
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    logging.error('Error fetching public IP: no provider returned a valid answer')
+    return None
 
 
 def load_multiple_records() -> list[dict[str, Any]]:
@@ -134,21 +459,38 @@ def load_multiple_records() -> list[dict[str, Any]]:
       API_TOKEN_1, ZONE_ID_1, RECORD_NAME_1, PROXIED_1
       API_TOKEN_2, ZONE_ID_2, RECORD_NAME_2, PROXIED_2
       etc.
+    Indices do not need to be contiguous (e.g. 1, 2 and 4 are all loaded). At most 256 records are loaded.
     :return: A list of record configuration dictionaries.
     """
     records: list[dict[str, Any]] = []
-    index: int = 1
+    seen: set[tuple[str, str]] = set()
+    env: Mapping[str, str] = os.environ
+
+    # Collect every numbered index in one sweep so gaps in the numbering are allowed
+    indices: list[int] = sorted({
+        int(match.group(1)) for key in env if (match := _API_TOKEN_KEY.fullmatch(key))
+    })
 
-    while True:
-        api_token: Optional[str] = os.getenv(f'API_TOKEN_{index}')
-        zone_id: Optional[str] = os.getenv(f'ZONE_ID_{index}')
-        record_name: Optional[str] = os.getenv(f'RECORD_NAME_{index}')
-        proxied_env: Optional[str] = os.getenv(f'PROXIED_{index}')
+    if len(indices) > _MAX_RECORDS:
+        logging.warning('Truncating records at %d (%d configured)', _MAX_RECORDS, len(indices))
+        indices = indices[:_MAX_RECORDS]
+
+    for index in indices:
+        api_token: Optional[str] = env.get(f'API_TOKEN_{index}')
+        zone_id: Optional[str] = env.get(f'ZONE_ID_{index}')
+        record_name: Optional[str] = env.get(f'RECORD_NAME_{index}')
+        proxied_env: Optional[str] = env.get(f'PROXIED_{index}')
 
-        # Stop when no more numbered records are found
         if not api_token or not zone_id or not record_name:
-            break
+            logging.warning('Incomplete configuration for record #%d. Ignoring...', index)
+            continue
 
+        # Skip records that target the same zone and name as a previous one
+        if (zone_id, record_name) in seen:
+            logging.warning('Duplicate record %s in zone %s (index %d). Ignoring...', record_name, zone_id, index)
+            continue
+
+        seen.add((zone_id, record_name))
         proxied: bool = parse_bool(proxied_env, default=True)
         records.append({
             'api_token': api_token,
@@ -156,12 +498,70 @@ def load_multiple_records() -> list[dict[str, Any]]:
             'record_name': record_name,
             'proxied': proxied
         })
-        index += 1
 
     return records
 
 
-def loop() -> None:
+def _watch_addresses(event_loop: asyncio.AbstractEventLoop, changed: asyncio.Event) -> None:
+    """
+    Blocks on netlink address notifications and flags every IPv4 address change.
+    Meant to run in a daemon thread.
+    :param event_loop: The event loop owning the event.
+    :param changed: The event set whenever an IPv4 address is added or removed.
+    """
+    try:
+        with IPRoute() as ipr:
+            # Subscribe to IPv4 address changes only; IPv6, route and link churn must not wake the loop
+            ipr.bind(groups=RTMGRP_IPV4_IFADDR)
+
+            while True:
+                for msg in ipr.get():
+                    if msg.get('event') in ('RTM_NEWADDR', 'RTM_DELADDR') and msg.get('family') == socket.AF_INET:
+                        event_loop.call_soon_threadsafe(changed.set)
+
+    except Exception as e:
+        logging.warning("Address change notifications stopped: %s", e)
+
+
+def start_address_watcher() -> Optional[asyncio.Event]:
+    """
+    Starts listening for local address changes through netlink on Linux when pyroute2 is installed.
+    :return: An event set on every address change, or None if notifications are not available.
+    """
+    if IPRoute is None or not sys.platform.startswith('linux'):
+        return None
+
+    changed: asyncio.Event = asyncio.Event()
+    threading.Thread(
+        target=_watch_addresses,
+        args=(asyncio.get_running_loop(), changed),
+        daemon=True
+    ).start()
+    logging.info('Listening for address changes through netlink')
+    return changed
+
+
+async def wait_for_change(changed: Optional[asyncio.Event], delay: float) -> None:
+    """
+    Waits until a local address change is notified or the delay elapses, whichever comes first.
+    :param changed: The address change event, or None to simply sleep.
+    :param delay: Maximum time to wait in seconds.
+    """
+    if changed is None:
+        await asyncio.sleep(delay)
+        return
+
+    try:
+        await asyncio.wait_for(changed.wait(), timeout=delay)
+        logging.info('Address change detected. Checking public IP...')
+
+    except asyncio.TimeoutError:
+        pass
+
+    changed.clear()
+
+
+async def loop() -> None:
     """ Infinite loop to update IP to Cloudflare in case router IP changes """
 
     # Load multiple record configurations (if exists)
@@ -194,47 +594,96 @@ def loop() -> None:
             if record_name is None:
                 missing.append('RECORD_NAME')
 
-            logging.error(f'Missing required environment variables: {", ".join(missing)}')
+            logging.error('Missing required environment variables: %s', ', '.join(missing))
             sys.exit(1)
 
-    delay: int = 120
-    current_ipaddress: Optional[str] = CloudflareUpdater.get_public_ip()
+    # Poll interval backs off while the IP stays stable and resets on any change
+    min_delay: int = 60
+    max_delay: int = 900
+    delay: float = min_delay
+    stable_count: int = 0
+    failures: int = 0
 
-    if current_ipaddress is None:
-        logging.error('Could not get the current IP address at first. Do you have an Internet connection?')
-        sys.exit(1)
+    async with build_client() as client:
+        current_ipaddress: Optional[str] = await get_public_ip(client)
 
-    updaters: list[CloudflareUpdater] = [
-        CloudflareUpdater(
-            api_token=record['api_token'],
-            zone_id=record['zone_id'],
-            record_name=record['record_name'],
-            proxied=record.get('proxied', True)
+        if current_ipaddress is None:
+            logging.error('Could not get the current IP address at first. Do you have an Internet connection?')
+            sys.exit(1)
+
+        # Group records by account and zone so each zone is listed with a single request
+        zone_updaters: dict[tuple[str, str], ZoneUpdater] = {}
+
+        for record in records:
+            key: tuple[str, str] = (record['api_token'], record['zone_id'])
+
+            if key not in zone_updaters:
+                zone_updaters[key] = ZoneUpdater(
+                    api_token=record['api_token'],
+                    zone_id=record['zone_id'],
+                    client=client
+                )
+
+            zone_updaters[key].updaters.append(
+                CloudflareUpdater(
+                    api_token=record['api_token'],
+                    zone_id=record['zone_id'],
+                    record_name=record['record_name'],
+                    client=client,
+                    proxied=record.get('proxied', True)
+                )
+            )
+
+        # Resolve record IDs up front so the first update only needs the PUTs
+        results: list[Any] = await asyncio.gather(
+            *(zu.fetch_records() for zu in zone_updaters.values()),
+            return_exceptions=True
         )
-        for record in records
-    ]
-    first: bool = True
 
-    while True:
-        if not first:
-            time.sleep(delay)
+        for zone_updater, result in zip(zone_updaters.values(), results):
+            if isinstance(result, Exception):
+                logging.error("Unexpected error listing DNS records for zone %s: %s", zone_updater.zone_id, result)
 
-        new_ipaddress: Optional[str] = CloudflareUpdater.get_public_ip()
+        # Address changes wake the loop early; the poll interval still catches changes made upstream (e.g. router NAT)
+        changed: Optional[asyncio.Event] = start_address_watcher()
+        first: bool = True
 
-        if new_ipaddress is None:
-            logging.warning('Could not get the new IP address. Skipping...')
-            continue
+        while True:
+            if not first or failures:
+                await wait_for_change(changed, delay)
 
-        if new_ipaddress == current_ipaddress and not first:
-            logging.info('The current IP address is the same as the previous one. Skipping...')
-            continue
+            new_ipaddress: Optional[str] = await get_public_ip(client)
+
+            # Back off with jitter while lookups keep failing, even before the first update
+            if new_ipaddress is None:
+                failures += 1
+                delay = min(max_delay, min_delay * (2 ** min(failures, 4)) * random.uniform(0.7, 1.3))
+                logging.warning('Could not get the new IP address. Retrying in %ds...', delay)
+                continue
+
+            failures = 0
+
+            if new_ipaddress == current_ipaddress and not first:
+                stable_count += 1
+                delay = min(max_delay, min_delay * (2 ** min(stable_count, 4)))
+                logging.info('The current IP address is the same as the previous one. Next check in %ds...', delay)
+                continue
+
+            # Update every zone concurrently
+            results = await asyncio.gather(
+                *(zu.update_all(new_ipaddress) for zu in zone_updaters.values()),
+                return_exceptions=True
+            )
 
-        for updater in updaters:
-            updater.update_dns_record(new_ipaddress)
+            for zone_updater, result in zip(zone_updaters.values(), results):
+                if isinstance(result, Exception):
+                    logging.error("Unexpected error updating zone %s: %s", zone_updater.zone_id, result)
 
-        current_ipaddress = new_ipaddress
-        first = False
+            current_ipaddress = new_ipaddress
+            first = False
+            stable_count = 0
+            delay = min_delay
 
 
 if __name__ == '__main__':
-    loop()
+    asyncio.run(loop())